@@ -1,6 +1,20 @@
 #!/usr/bin/env python3
+import json
 import os
-import re
+import stat
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import mmap
+except ImportError:
+    mmap = None
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
 
 CATEGORIES = {
     'Frontend Development / 前端开发': ['react-best-practices', 'web-design-guidelines', 'implement-frontend', 'design-ui', 'audit-ui', 'ui-animation', 'nextjs', 'react', 'tailwind-v4-shadcn', 'tailwind-patterns', 'shadcn', 'tanstack-query', 'tanstack-router', 'tanstack-table', 'zustand-state-management', 'react-hook-form-zod', 'motion', 'mui', 'ui-ux-pro-max', 'vercel-react-native-skills', 'vercel-react-best-practices', 'vercel-composition-patterns'],
@@ -14,9 +28,108 @@ CATEGORIES = {
     'General / 通用': ['chinese-default', 'template-skill']
 }
 
+# Interned so repeated dict lookups on category and skill names compare by identity
+CATEGORIES = {sys.intern(k): [sys.intern(s) for s in v] for k, v in CATEGORIES.items()}
+
+SKILL_TO_CATEGORY = {s: cat for cat, skills in CATEGORIES.items() for s in skills}
+CATEGORY_SKILL_ORDER = {cat: {s: i for i, s in enumerate(skills)} for cat, skills in CATEGORIES.items()}
+OTHER_CATEGORY = '__OTHER__'
+
+TRIGGER_HEADERS = ('## Triggers', '## 触发条件')
+EFFECT_HEADERS = ('## Effect', '## 效果')
+# (section heading, next heading) delimiting the generated block in each README
+README_ZH_SECTION = ('## Skills 概览\n', '\n## 目录结构')
+README_EN_SECTION = ('## Skills Overview\n', '\n## Directory Structure')
+
+PIPE_ESCAPE = str.maketrans({'|': r'\|'})
+ROW_TEMPLATE = "| [`{name}`](./skills/{name}/SKILL.md) | {desc} | {trig} | {eff} |\n"
+
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Parsed SKILL.md info keyed by path, reused while (mtime, size) is unchanged.
+# Bump CACHE_VERSION whenever parse_skill_md output changes.
+CACHE_PATH = os.path.join('.cache', 'skills_parse.json')
+CACHE_VERSION = 1
+
+def read_frontmatter(f):
+    # Consume the leading '---' block line by line so the body is only read when needed
+    first = f.readline()
+    if first.rstrip('\n') != '---':
+        return None, first
+
+    lines = []
+    while True:
+        line = f.readline()
+        if not line:
+            # Unterminated frontmatter, treat the whole file as body
+            return None, first + ''.join(lines)
+        if line.startswith('---'):
+            return ''.join(lines).rstrip('\n'), ''
+        lines.append(line)
+
+def scan_frontmatter(fm):
+    # Minimal line scanner, used when PyYAML is unavailable or the YAML is invalid
+    meta = {}
+    block_key = None
+    block_lines = []
+    for line in fm.split('\n'):
+        if block_key is not None:
+            # Block scalar (| or >) or indented plain value runs until the next unindented key
+            if not (line and line[0] != ' ' and ':' in line):
+                block_lines.append(line.strip())
+                continue
+            meta[block_key] = ' '.join(block_lines)
+            block_key = None
+
+        key, sep, val = line.partition(':')
+        if not sep or key not in ('name', 'description'):
+            continue
+        val = val.strip()
+        if not val or val[:1] in ('|', '>'):
+            block_key = key
+            block_lines = []
+        elif len(val) >= 2 and val[0] == val[-1] and val[0] in '"\'':
+            meta[key] = val[1:-1]
+        else:
+            meta[key] = val
+
+    if block_key is not None:
+        meta[block_key] = ' '.join(block_lines)
+    return meta
+
+def load_frontmatter(fm):
+    if yaml is not None:
+        try:
+            meta = yaml.safe_load(fm)
+        except yaml.YAMLError:
+            meta = None
+        if isinstance(meta, dict):
+            return meta
+    return scan_frontmatter(fm)
+
+def find_section(body, headers, start=0):
+    # Headings are literal, so plain str.find is enough; returns (text, end) or None
+    pos = -1
+    for header in headers:
+        p = body.find(header, start)
+        if p != -1 and (pos == -1 or p < pos):
+            pos = p
+    if pos == -1:
+        return None
+
+    # Section text starts on the line after the heading and runs to the next '## '
+    line_end = body.find('\n', pos)
+    if line_end == -1:
+        return None
+    end = body.find('\n## ', line_end)
+    if end == -1:
+        end = len(body)
+    return body[line_end + 1:end], end
+
 def parse_skill_md(file_path):
     with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+        fm, head = read_frontmatter(f)
+        body = head + f.read()
 
     info = {
         'name': os.path.basename(os.path.dirname(file_path)),
@@ -26,128 +139,216 @@ def parse_skill_md(file_path):
     }
 
     # Extract name/desc from frontmatter
-    frontmatter_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if frontmatter_match:
-        fm = frontmatter_match.group(1)
-        for line in fm.split('\n'):
-            if line.startswith('description:'):
-                val = line.split(':', 1)[1].strip()
-                if val == '|' or val == '>':
-                    info['description'] = "See details."
-                else:
-                    info['description'] = val.strip('"\'')
-            if line.startswith('name:'):
-                info['name'] = line.split(':', 1)[1].strip()
+    if fm is not None:
+        meta = load_frontmatter(fm)
+        if meta.get('name'):
+            info['name'] = str(meta['name'])
+        description = meta.get('description')
+        if description:
+            # Block scalars keep their newlines, which would break the table row
+            info['description'] = ' '.join(str(description).split())
 
     # Extract Triggers
-    triggers_match = re.search(r'## (Triggers|触发条件).*?\n(.*?)(?=\n## |$)', content, re.DOTALL | re.IGNORECASE)
-    if triggers_match:
-        triggers_text = triggers_match.group(2)
-        info['triggers'] = [line.strip('- ').strip() for line in triggers_text.split('\n') if line.strip().startswith('-')]
+    triggers = find_section(body, TRIGGER_HEADERS)
+    if triggers:
+        triggers_text, triggers_end = triggers
+        info['triggers'] = [line.strip('- ').strip() for line in triggers_text.splitlines() if line.strip().startswith('-')]
 
-    # Extract Effect
-    effect_match = re.search(r'## (Effect|效果).*?\n(.*?)(?=\n## |$)', content, re.DOTALL | re.IGNORECASE)
-    if effect_match:
-        effect_text = effect_match.group(2)
-        info['effect'] = [line.strip('- ').strip() for line in effect_text.split('\n') if line.strip().startswith('-')]
+    # Extract Effect, usually right after Triggers so resume scanning from there
+    effect = None
+    if triggers:
+        effect = find_section(body, EFFECT_HEADERS, triggers_end)
+    if not effect:
+        effect = find_section(body, EFFECT_HEADERS)
+    if effect:
+        effect_text, _ = effect
+        info['effect'] = [line.strip('- ').strip() for line in effect_text.splitlines() if line.strip().startswith('-')]
 
     return info
 
-def generate_markdown(skills_map, lang='zh'):
-    if lang == 'zh':
-        title = "## Skills 概览"
-        headers = "| Skill | 描述 (Description) | 触发条件 (Triggers) | 效果 (Effect) |"
-        other = "### Other / 其他"
-    else:
-        title = "## Skills Overview"
-        headers = "| Skill | Description | Triggers | Effect |"
-        other = "### Other"
+def render_rows(skills):
+    return "".join(ROW_TEMPLATE.format(
+        name=skill['name'],
+        desc=skill['description'].translate(PIPE_ESCAPE),
+        trig='<br>'.join(skill['triggers']) or '-',
+        eff='<br>'.join(skill['effect']) or '-',
+    ) for skill in skills)
 
-    md = f"{title}\n\n"
-    
-    processed_skills = set()
+def generate_both(skills_map):
+    zh_headers = "| Skill | 描述 (Description) | 触发条件 (Triggers) | 效果 (Effect) |"
+    en_headers = "| Skill | Description | Triggers | Effect |"
+
+    zh_parts = ["## Skills 概览", "\n\n"]
+    en_parts = ["## Skills Overview", "\n\n"]
     
-    for category_key, skill_names in CATEGORIES.items():
-        if lang == 'en':
-            cat_name = category_key.split(' / ')[0]
-        else:
-            cat_name = category_key
-            
-        category_skills = []
-        for name in skill_names:
-            if name in skills_map:
-                category_skills.append(skills_map[name])
-                processed_skills.add(name)
-        
-        if category_skills:
-            md += f"### {cat_name}\n\n"
-            md += f"{headers}\n"
-            md += "|---|---|---|---|\n"
-            for skill in category_skills:
-                name_link = f"[`{skill['name']}`](./skills/{skill['name']}/SKILL.md)"
-                desc = skill['description'].replace('|', '\|')
-                triggers = '<br>'.join(skill['triggers']) if skill['triggers'] else '-'
-                effect = '<br>'.join(skill['effect']) if skill['effect'] else '-'
-                md += f"| {name_link} | {desc} | {triggers} | {effect} |\n"
-            md += "\n"
-            
-    # Process uncategorized
-    uncategorized = []
+    buckets = defaultdict(list)
     for name, skill in skills_map.items():
-        if name not in processed_skills:
-            uncategorized.append(skill)
-            
+        buckets[SKILL_TO_CATEGORY.get(name, OTHER_CATEGORY)].append(skill)
+
+    # (zh heading, en heading, skills) in render order, uncategorized last
+    sections = []
+    for category_key, skill_order in CATEGORY_SKILL_ORDER.items():
+        category_skills = buckets.get(category_key)
+        if not category_skills:
+            continue
+        category_skills.sort(key=lambda skill: skill_order.get(skill['name'], 1 << 30))
+        sections.append((category_key, category_key.split(' / ')[0], category_skills))
+
+    uncategorized = buckets.get(OTHER_CATEGORY)
     if uncategorized:
-        md += f"{other}\n\n"
-        md += f"{headers}\n"
-        md += "|---|---|---|---|\n"
-        for skill in uncategorized:
-            name_link = f"[`{skill['name']}`](./skills/{skill['name']}/SKILL.md)"
-            desc = skill['description'].replace('|', '\|')
-            triggers = '<br>'.join(skill['triggers']) if skill['triggers'] else '-'
-            effect = '<br>'.join(skill['effect']) if skill['effect'] else '-'
-            md += f"| {name_link} | {desc} | {triggers} | {effect} |\n"
-        md += "\n"
+        sections.append(("Other / 其他", "Other", uncategorized))
+
+    # Rows are language-invariant, render them once and share between both outputs
+    for zh_name, en_name, skills in sections:
+        rows = render_rows(skills)
+        zh_parts.append(f"### {zh_name}\n\n{zh_headers}\n|---|---|---|---|\n")
+        zh_parts.append(rows)
+        zh_parts.append("\n")
+        en_parts.append(f"### {en_name}\n\n{en_headers}\n|---|---|---|---|\n")
+        en_parts.append(rows)
+        en_parts.append("\n")
             
-    return md
+    return "".join(zh_parts), "".join(en_parts)
+
+def splice_readme(path, section, new_section):
+    # Splice through an mmap so the untouched prefix is never copied or rewritten
+    with open(path, 'r+b') as f:
+        with mmap.mmap(f.fileno(), 0) as m:
+            # Match the file's line endings, e.g. a CRLF checkout with core.autocrlf
+            for newline in ('\n', '\r\n'):
+                start_marker, end_marker, new_bytes = (
+                    text.replace('\n', newline).encode('utf-8') for text in (*section, new_section))
+                start = m.find(start_marker)
+                end = m.find(end_marker, start + len(start_marker)) if start != -1 else -1
+                if end != -1:
+                    break
+            else:
+                return 'missing'
+            if m[start:end] == new_bytes:
+                return 'unchanged'
+            if end - start == len(new_bytes):
+                m[start:end] = new_bytes
+                m.flush()
+                return 'updated'
+            suffix = m[end:]
+        f.seek(start)
+        f.write(new_bytes)
+        f.write(suffix)
+        f.truncate()
+    return 'updated'
+
+def rewrite_readme(path, section, new_section):
+    start_marker, end_marker = section
+    with open(path, 'r+', encoding='utf-8') as f:
+        readme = f.read()
+        start = readme.find(start_marker)
+        end = readme.find(end_marker, start + len(start_marker)) if start != -1 else -1
+        if end == -1:
+            return 'missing'
+        if readme[start:end] == new_section:
+            return 'unchanged'
+        f.seek(0)
+        f.write(readme[:start] + new_section + readme[end:])
+        f.truncate()
+    return 'updated'
+
+def update_readme(path, section, new_content):
+    new_section = new_content.strip() + '\n'
+    status = None
+    if mmap is not None:
+        try:
+            status = splice_readme(path, section, new_section)
+        except (ValueError, OSError):
+            # Empty files, or filesystems (some FUSE/network mounts) that cannot be mapped
+            pass
+    if status is None or status == 'missing':
+        # Text mode normalizes line endings, so give it a second chance
+        status = rewrite_readme(path, section, new_section)
+
+    if status == 'missing':
+        print(f"Could not find section to replace in {path}")
+    elif status == 'unchanged':
+        print(f"{path} is up to date")
+    else:
+        print(f"Updated {path}")
+
+def cache_header():
+    # Parse output also depends on which frontmatter parser is available
+    return {'version': CACHE_VERSION, 'yaml': yaml is not None}
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    header = cache_header()
+    if not isinstance(data, dict) or any(data.get(k) != v for k, v in header.items()):
+        return {}
+    return data.get('skills', {})
+
+def save_cache(skills):
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump({**cache_header(), 'skills': skills}, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"Could not write cache {CACHE_PATH}: {e}")
 
 def main():
     root = 'skills'
     skills_map = {}
     
-    for d in sorted(os.listdir(root)):
-        path = os.path.join(root, d)
-        if os.path.isdir(path) and os.path.exists(os.path.join(path, 'SKILL.md')):
-            try:
-                info = parse_skill_md(os.path.join(path, 'SKILL.md'))
-                skills_map[d] = info
-                skills_map[d]['name'] = d
-            except Exception as e:
-                print(f"Error parsing {d}: {e}")
+    with os.scandir(root) as it:
+        entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+
+    cache = load_cache()
+    new_cache = {}
+    candidates = []
+    for entry in entries:
+        skill_md = os.path.join(entry.path, 'SKILL.md')
+        try:
+            st = os.stat(skill_md)
+        except FileNotFoundError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+
+        key = f"{st.st_mtime_ns}:{st.st_size}"
+        cached = cache.get(skill_md)
+        if cached and cached.get('key') == key:
+            new_cache[skill_md] = cached
+        candidates.append((entry.name, skill_md, key))
+
+    # SKILL.md reads are I/O bound and independent, so parse the stale ones concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = [(d, skill_md, key, ex.submit(parse_skill_md, skill_md))
+                   for d, skill_md, key in candidates if skill_md not in new_cache]
+
+    for d, skill_md, key, future in futures:
+        try:
+            new_cache[skill_md] = {'key': key, 'info': future.result()}
+        except FileNotFoundError:
+            # Removed since it was stat'ed
+            continue
+        except Exception as e:
+            print(f"Error parsing {d}: {e}")
+
+    for d, skill_md, _ in candidates:
+        if skill_md in new_cache:
+            d = sys.intern(d)
+            skills_map[d] = dict(new_cache[skill_md]['info'], name=d)
+
+    if new_cache != cache:
+        save_cache(new_cache)
+
+    new_content_zh, new_content_en = generate_both(skills_map)
 
     # Update README.md
-    new_content_zh = generate_markdown(skills_map, 'zh')
-    with open('README.md', 'r', encoding='utf-8') as f:
-        readme = f.read()
-    pattern_zh = r'(## Skills 概览\n)([\s\S]*?)(?=\n## 目录结构)'
-    if re.search(pattern_zh, readme):
-        updated_readme = re.sub(pattern_zh, new_content_zh.strip() + '\n', readme)
-        with open('README.md', 'w', encoding='utf-8') as f:
-            f.write(updated_readme)
-        print("Updated README.md")
-    else:
-        print("Could not find section to replace in README.md")
+    update_readme('README.md', README_ZH_SECTION, new_content_zh)
 
     # Update README_EN.md
-    new_content_en = generate_markdown(skills_map, 'en')
-    with open('README_EN.md', 'r', encoding='utf-8') as f:
-        readme_en = f.read()
-    pattern_en = r'(## Skills Overview\n)([\s\S]*?)(?=\n## Directory Structure)'
-    if re.search(pattern_en, readme_en):
-        updated_readme_en = re.sub(pattern_en, new_content_en.strip() + '\n', readme_en)
-        with open('README_EN.md', 'w', encoding='utf-8') as f:
-            f.write(updated_readme_en)
-        print("Updated README_EN.md")
+    update_readme('README_EN.md', README_EN_SECTION, new_content_en)
 
 if __name__ == '__main__':
     main()
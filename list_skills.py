@@ -1,45 +1,55 @@
 #!/usr/bin/env python3
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+class State:
+    # get_skill_info parser states
+    PRE = 0
+    FRONTMATTER = 1
+    DESCRIPTION_BLOCK = 2
 
 def get_skill_info(skill_dir):
+    # A missing SKILL.md surfaces as FileNotFoundError from open() below
     skill_md = os.path.join(skill_dir, 'SKILL.md')
-    if not os.path.exists(skill_md):
-        return None
     
     info = {'id': os.path.basename(skill_dir), 'name': '', 'description': ''}
     
     try:
-        with open(skill_md, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            
-        in_frontmatter = False
-        if lines and lines[0].strip() == '---':
-            in_frontmatter = True
-            lines = lines[1:]
-        
         description_lines = []
-        reading_description = False
+        state = State.PRE
         
-        for line in lines:
-            if line.strip() == '---':
-                break
-            
-            if reading_description:
-                # If line starts with a key (no indentation), stop
-                if line and line[0] != ' ' and ':' in line:
+        with open(skill_md, 'r', encoding='utf-8') as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped == '---':
+                    # Skip the opening delimiter, stop reading at the closing one
+                    if state == State.PRE:
+                        state = State.FRONTMATTER
+                        continue
                     break
-                description_lines.append(line.strip())
-            
-            elif line.startswith('name:'):
-                info['name'] = line.split(':', 1)[1].strip().strip('"\'')
                 
-            elif line.startswith('description:'):
-                val = line.split(':', 1)[1].strip()
-                if val == '|' or val == '>':
-                    reading_description = True
+                if state == State.DESCRIPTION_BLOCK:
+                    # If line starts with a key (no indentation), stop
+                    if line[0] != ' ' and ':' in line:
+                        break
+                    description_lines.append(stripped)
+                
                 else:
-                    info['description'] = val.strip('"\'')
+                    state = State.FRONTMATTER
+                    key, sep, val = line.partition(':')
+                    if not sep:
+                        continue
+                    if key == 'name':
+                        info['name'] = val.strip().strip('"\'')
+                    elif key == 'description':
+                        val = val.strip()
+                        if val == '|' or val == '>':
+                            state = State.DESCRIPTION_BLOCK
+                        else:
+                            info['description'] = val.strip('"\'')
                     
         if description_lines:
             info['description'] = ' '.join(description_lines)
@@ -68,13 +78,11 @@ def main():
             print(f"Skills directory not found at {skills_dir}")
             return
         
-    skills = []
-    for d in sorted(os.listdir(skills_dir)):
-        path = os.path.join(skills_dir, d)
-        if os.path.isdir(path):
-            info = get_skill_info(path)
-            if info:
-                skills.append(info)
+    with os.scandir(skills_dir) as it:
+        paths = [e.path for e in sorted((e for e in it if e.is_dir()), key=lambda e: e.name)]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        skills = [info for info in ex.map(get_skill_info, paths) if info]
     
     # Print table
     print(f"\033[1;34m{'SKILL ID':<35} | {'DESCRIPTION'}\033[0m")
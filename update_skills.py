@@ -5,6 +5,98 @@ import shutil
 import subprocess
 import tempfile
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+MAX_WORKERS = 8
+
+# Never prompt for credentials, leaving any inherited GIT_CONFIG_* settings untouched
+GIT_ENV = {**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+
+# Protocol v2 so the server only advertises the refs we ask for
+GIT_CONFIG = ['-c', 'protocol.version=2', '-c', 'fetch.parallel=0']
+
+def git(*args):
+    subprocess.check_call(['git', *GIT_CONFIG, *args], env=GIT_ENV, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def dangling_links(root):
+    dangling = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path) and not os.path.exists(path):
+                dangling.append(os.path.relpath(path, root))
+    return dangling
+
+def clone_repo(repo_url, branch, dest, subpaths=()):
+    last_error = None
+    # Fallback to default branch if the configured one does not exist
+    for branch_args in (['-b', branch], []):
+        if subpaths and all(subpaths):
+            # Partial clone + sparse checkout only fetches blobs under subpaths
+            try:
+                git('clone', '--depth', '1', '--filter=blob:none', '--sparse', *branch_args, repo_url, dest)
+                git('-C', dest, 'sparse-checkout', 'set', *subpaths)
+                # Symlinks may point outside the sparse set, materialize the full tree then
+                if any(dangling_links(os.path.join(dest, subpath)) for subpath in subpaths):
+                    git('-C', dest, 'sparse-checkout', 'disable')
+                return
+            except subprocess.CalledProcessError:
+                # Server (or local git) may not support it, retry with a full clone
+                shutil.rmtree(dest, ignore_errors=True)
+
+        try:
+            git('clone', '--depth', '1', *branch_args, repo_url, dest)
+            return
+        except subprocess.CalledProcessError as e:
+            last_error = e
+            shutil.rmtree(dest, ignore_errors=True)
+
+    raise last_error
+
+def link_or_copy(src, dst):
+    # os.link would hardlink a symlink itself (even a dangling one), only link regular files
+    if os.path.islink(src):
+        return shutil.copy2(src, dst)
+    os.link(src, dst)
+    return dst
+
+def update_one(skill_id, repo_subpath, repo_dir, skills_dir):
+    target_skill_dir = os.path.join(skills_dir, skill_id)
+
+    source_path = os.path.join(repo_dir, repo_subpath)
+    if not os.path.exists(source_path):
+        return f"  ❌ {skill_id}: Path {repo_subpath} not found in repo."
+
+    dangling = dangling_links(source_path)
+    if dangling:
+        return f"  ❌ {skill_id}: Dangling symlinks in {repo_subpath or 'repo'}: {', '.join(dangling)}"
+
+    # If target exists, remove it
+    if os.path.exists(target_skill_dir):
+        shutil.rmtree(target_skill_dir)
+
+    # Hardlink from the clone into target, the links outlive the temp dir
+    ignore = shutil.ignore_patterns('.git', '.github', '.DS_Store')
+    try:
+        shutil.copytree(source_path, target_skill_dir, ignore=ignore, copy_function=link_or_copy)
+    except OSError:
+        # Cross-device or unsupported filesystem, fall back to a plain copy
+        shutil.rmtree(target_skill_dir, ignore_errors=True)
+        shutil.copytree(source_path, target_skill_dir, ignore=ignore)
+    return f"  ✓ Successfully updated {skill_id}"
+
+def update_repo(repo_url, branch, members, skills_dir):
+    subpaths = [repo_subpath for _, repo_subpath in members]
+
+    # Each worker clones into its own temp dir, shared by every skill from this repo
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            clone_repo(repo_url, branch, temp_dir, subpaths)
+        except subprocess.CalledProcessError:
+            return [f"  ❌ {skill_id}: Failed to clone {repo_url}" for skill_id, _ in members]
+
+        return [update_one(skill_id, repo_subpath, temp_dir, skills_dir) for skill_id, repo_subpath in members]
 
 def main():
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -25,44 +117,28 @@ def main():
 
     print(f"Found {len(sources)} skills with upstream sources.")
 
+    # Skills living in the same upstream repo share a single clone
+    grouped = defaultdict(list)
     for skill_id, config in sources.items():
         repo_url = config.get('url')
         if not repo_url:
             continue
-            
+
         print(f"Updating {skill_id} from {repo_url}...")
-            
-        branch = config.get('branch', 'main')
-        repo_subpath = config.get('path', '')
-        
-        target_skill_dir = os.path.join(skills_dir, skill_id)
-        
-        # Create temp dir
-        with tempfile.TemporaryDirectory() as temp_dir:
+        grouped[(repo_url, config.get('branch', 'main'))].append((skill_id, config.get('path', '')))
+
+    # Clones are network bound and independent, run them concurrently
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = {ex.submit(update_repo, repo_url, branch, members, skills_dir): members
+                   for (repo_url, branch), members in grouped.items()}
+
+        for future in as_completed(futures):
             try:
-                subprocess.check_call(['git', 'clone', '--depth', '1', '-b', branch, repo_url, temp_dir], 
-                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            except subprocess.CalledProcessError:
-                try:
-                    # Fallback to default branch
-                    subprocess.check_call(['git', 'clone', '--depth', '1', repo_url, temp_dir],
-                                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                except:
-                    print(f"  ❌ Failed to clone {repo_url}")
-                    continue
-
-            source_path = os.path.join(temp_dir, repo_subpath)
-            if not os.path.exists(source_path):
-                print(f"  ❌ Path {repo_subpath} not found in repo.")
-                continue
-                
-            # If target exists, remove it
-            if os.path.exists(target_skill_dir):
-                shutil.rmtree(target_skill_dir)
-            
-            # Copy from source to target
-            shutil.copytree(source_path, target_skill_dir, ignore=shutil.ignore_patterns('.git', '.github', '.DS_Store'))
-            print(f"  ✓ Successfully updated {skill_id}")
+                for line in future.result():
+                    print(line)
+            except Exception as e:
+                for skill_id, _ in futures[future]:
+                    print(f"  ❌ Failed to update {skill_id}: {e}")
 
 if __name__ == '__main__':
     main()